@@ -8,26 +8,260 @@ import math
 import random
 import json
 import os
+import pickle
 import sys
 import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict
 
+# Numba is optional: when present the hard-difficulty search is
+# JIT-compiled; without it the pure-Python paths below are used
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# orjson is optional too: it encodes straight to bytes in C, and the
+# stdlib fallback skips the indented encoder on the per-game save path
+try:
+    import orjson
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data)
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data, separators=(',', ':')).encode()
+
+# The board is a pair of 9-bit bitboards (bit i = cell i occupied).
+# Winning lines as 9-bit masks: rows, columns, diagonals.
+WIN_MASKS = (0o7, 0o70, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+FULL_BOARD = 0x1FF
+
+# Winning lines through each cell (4 for the center, 3 for corners,
+# 2 for edges), so a move only checks the lines it can complete
+LINES_THROUGH = tuple(tuple(m for m in WIN_MASKS if (m >> i) & 1)
+                      for i in range(9))
+
+# Tactically strongest squares first (center, corners, edges) so
+# alpha-beta cutoffs fire as early as possible
+STATIC_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+CORNERS = (0, 2, 6, 8)
+EDGES = (1, 3, 5, 7)
+
+# Perfect replies to a lone opening stone: take the center, or a corner
+# if the opponent already holds the center
+OPENING_REPLY = {1 << i: (0 if i == 4 else 4) for i in range(9)}
+
+# The board's eight symmetries (identity, rotations, reflections) as
+# cell permutations: SYMS[s][i] is where cell i lands under symmetry s
+_ROT = tuple(3 * (i % 3) + 2 - i // 3 for i in range(9))       # 90° clockwise
+_MIRROR = tuple(3 * (i // 3) + 2 - i % 3 for i in range(9))    # flip columns
+
+
+def _compose(p: Tuple[int, ...], q: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Permutation applying p, then q."""
+    return tuple(q[p[i]] for i in range(9))
+
+
+def _build_syms() -> Tuple[Tuple[int, ...], ...]:
+    syms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        syms.append(perm)
+        syms.append(_compose(perm, _MIRROR))
+        perm = _compose(perm, _ROT)
+    return tuple(syms)
+
+
+SYMS = _build_syms()
+
+# Bitboard permutation per symmetry, precomputed over all 512 9-bit
+# values, plus the inverse cell maps to translate a move found in the
+# canonical frame back to the real board
+_PERM = tuple(
+    tuple(sum(((bb >> i) & 1) << sym[i] for i in range(9)) for bb in range(512))
+    for sym in SYMS
+)
+_INV = tuple(tuple(sym.index(j) for j in range(9)) for sym in SYMS)
+
+
+def _canonical(bx: int, bo: int) -> Tuple[int, int, int]:
+    """Map a position to its smallest symmetric twin.
+
+    Returns (cbx, cbo, s) where (cbx, cbo) is the lexicographically
+    minimal image of the position over SYMS and s is the symmetry that
+    produced it (so _INV[s] maps canonical-frame moves back).
+    """
+    best_bx, best_bo, best_s = bx, bo, 0
+    for s in range(1, 8):
+        table = _PERM[s]
+        pbx = table[bx]
+        if pbx > best_bx:
+            continue
+        pbo = table[bo]
+        if pbx < best_bx or pbo < best_bo:
+            best_bx, best_bo, best_s = pbx, pbo, s
+    return best_bx, best_bo, best_s
+CORNER_MASK = 0b101000101  # cells 0, 2, 6, 8
+EDGE_MASK = 0b010101010    # cells 1, 3, 5, 7
+
+# Transposition-table entry flags
+TT_EXACT = 0
+TT_LOWERBOUND = 1
+TT_UPPERBOUND = 2
+
+# Bump when the pickled policy format changes so stale caches rebuild
+POLICY_VERSION = 2  # v2: symmetry-canonical keys
+
+# int.bit_count is a single C call on Python 3.10+; older interpreters
+# fall back to the bin() trick
+try:
+    _popcount = int.bit_count
+except AttributeError:
+    def _popcount(bb: int) -> int:
+        return bin(bb).count('1')
+
+
+def _minimax_nb(bx: int, bo: int, depth: int, alpha: int, beta: int,
+                maximizing: bool) -> Tuple[int, int, int]:
+    """Alpha-beta search over bitboards as a free function of plain ints.
+
+    Touches no Python objects beyond int tuples, so Numba compiles it to
+    native code when available. Returns (score, best_move, nodes).
+    """
+    for mask in WIN_MASKS:
+        if bx & mask == mask:
+            return 10 - depth, -1, 1
+        if bo & mask == mask:
+            return -10 + depth, -1, 1
+    occupied = bx | bo
+    if occupied == FULL_BOARD:
+        return 0, -1, 1
+
+    nodes = 1
+    best_move = -1
+    if maximizing:
+        best_score = -1000
+        for move in STATIC_ORDER:
+            if (occupied >> move) & 1:
+                continue
+            score, _, child_nodes = _minimax_nb(
+                bx | (1 << move), bo, depth + 1, alpha, beta, False)
+            nodes += child_nodes
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if beta <= alpha:
+                break
+    else:
+        best_score = 1000
+        for move in STATIC_ORDER:
+            if (occupied >> move) & 1:
+                continue
+            score, _, child_nodes = _minimax_nb(
+                bx, bo | (1 << move), depth + 1, alpha, beta, True)
+            nodes += child_nodes
+            if score < best_score:
+                best_score = score
+                best_move = move
+            if score < beta:
+                beta = score
+            if beta <= alpha:
+                break
+
+    return best_score, best_move, nodes
+
+
+if HAVE_NUMBA:
+    _minimax_nb = njit(cache=True)(_minimax_nb)
+
+
+def _bits(bb: int):
+    """Yield the indices of set bits, lowest first (bit-scan pop loop)."""
+    while bb:
+        yield (bb & -bb).bit_length() - 1
+        bb &= bb - 1
+
+
+@lru_cache(maxsize=8192)
+def _evaluate(bx: int, bo: int) -> int:
+    """Heuristic score for a position, from X's point of view.
+
+    Pure function of the two bitboards, so results are memoized; the
+    whole reachable state space fits comfortably in the cache.
+    """
+    for mask in WIN_MASKS:
+        if bx & mask == mask:
+            return 100
+    for mask in WIN_MASKS:
+        if bo & mask == mask:
+            return -100
+
+    score = 0
+
+    # Award points for potential wins on each line
+    for mask in WIN_MASKS:
+        x_count = _popcount(bx & mask)
+        o_count = _popcount(bo & mask)
+        empty_count = 3 - x_count - o_count
+
+        if x_count == 2 and empty_count == 1:
+            score += 10
+        elif o_count == 2 and empty_count == 1:
+            score -= 10
+        elif x_count == 1 and empty_count == 2:
+            score += 1
+        elif o_count == 1 and empty_count == 2:
+            score -= 1
+
+    # Center control bonus
+    if (bx >> 4) & 1:
+        score += 3
+    elif (bo >> 4) & 1:
+        score -= 3
+
+    # Corner control bonus
+    score += 2 * _popcount(bx & CORNER_MASK)
+    score -= 2 * _popcount(bo & CORNER_MASK)
+
+    return score
+
+
+@lru_cache(maxsize=None)
+def _ordered_moves(first: int, second: int) -> Tuple[int, ...]:
+    """Static order with up to two priority moves (-1 = none) promoted."""
+    head = []
+    for move in (first, second):
+        if move >= 0 and move not in head:
+            head.append(move)
+    return tuple(head + [m for m in STATIC_ORDER if m not in head])
+
 class UltimateTicTacToeAI:
     def __init__(self):
-        self.board = [' ' for _ in range(9)]  # 3x3 board
+        self.bx = 0  # X bitboard
+        self.bo = 0  # O bitboard
         self.current_winner = None
         self.ai_player = 'X'
         self.human_player = 'O'
         self.difficulty = 'unbeatable'  # 'easy', 'medium', 'hard', 'unbeatable'
+        self.show_animations = False  # cosmetic sleeps add ~2s per AI move
         self.ai_wins = 0
         self.human_wins = 0
         self.ties = 0
-        self.game_history = []
+        self.game_history = deque(maxlen=20)  # last 20 games, old ones drop off
         self.game_id = 1
         self.save_file = 'tictactoe_stats.json'
+        self.policy_file = 'policy.pkl'
         self.thinking_depth = 0
         self.nodes_explored = 0
+        self._tt = {}  # (canonical bx, bo, is_maximizing) -> (depth, flag, value, move)
+        self._killer = [-1] * 10  # cutoff move per search depth
+        self._policy = self._load_policy()
         self.load_statistics()
         
         # ANSI color codes for cross-platform terminal colors
@@ -43,15 +277,97 @@ class UltimateTicTacToeAI:
             'UNDERLINE': '\033[4m',
             'RESET': '\033[0m'
         }
-    
+        # Precomputed (prefix, reset) pairs so color_text is one dict hit
+        self._wrap = {k: (v, self.colors['RESET']) for k, v in self.colors.items()}
+
     def color_text(self, text: str, color: str) -> str:
         """Color text using ANSI codes."""
-        return f"{self.colors.get(color, '')}{text}{self.colors['RESET']}"
+        prefix, reset = self._wrap.get(color, ('', ''))
+        return f"{prefix}{text}{reset}"
     
     def clear_screen(self):
         """Clear terminal screen cross-platform."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # The UI already emits raw ANSI colors, so a VT-capable terminal
+        # is assumed; this avoids spawning a subprocess per refresh
+        sys.stdout.write('\033[2J\033[H')
+        sys.stdout.flush()
     
+    def _load_policy(self) -> Dict:
+        """Load the cached perfect-play policy, building it on first run."""
+        try:
+            if os.path.exists(self.policy_file):
+                with open(self.policy_file, 'rb') as f:
+                    version, policy = pickle.load(f)
+                    if version == POLICY_VERSION:
+                        return policy
+        except Exception:
+            # Corrupted or stale cache, rebuild below
+            pass
+
+        policy = self._build_policy()
+        try:
+            with open(self.policy_file, 'wb') as f:
+                pickle.dump((POLICY_VERSION, policy), f)
+        except Exception:
+            pass
+        return policy
+
+    def _build_policy(self) -> Dict:
+        """Solve every reachable position once and record X's best move.
+
+        A single memoized depth-first minimax over the bitboards covers
+        the reachable states; positions are keyed by their symmetry-
+        canonical form, which shrinks the space roughly eightfold. The
+        returned dict maps (canonical bx, bo, 0) -> best move in the
+        canonical frame with X to move (0 = X's turn).
+        """
+        memo = {}
+        policy = {}
+
+        def solve(bx: int, bo: int, x_to_move: bool, depth: int) -> int:
+            cbx, cbo, sym = _canonical(bx, bo)
+            key = (cbx, cbo, x_to_move)
+            if key in memo:
+                return memo[key]
+
+            for mask in WIN_MASKS:
+                if bx & mask == mask:
+                    memo[key] = 10 - depth
+                    return memo[key]
+            for mask in WIN_MASKS:
+                if bo & mask == mask:
+                    memo[key] = -10 + depth
+                    return memo[key]
+            occupied = bx | bo
+            if occupied == FULL_BOARD:
+                memo[key] = 0
+                return 0
+
+            best_score = -math.inf if x_to_move else math.inf
+            best_move = -1
+            for move in range(9):
+                if (occupied >> move) & 1:
+                    continue
+                bit = 1 << move
+                if x_to_move:
+                    score = solve(bx | bit, bo, False, depth + 1)
+                    if score > best_score:
+                        best_score, best_move = score, move
+                else:
+                    score = solve(bx, bo | bit, True, depth + 1)
+                    if score < best_score:
+                        best_score, best_move = score, move
+
+            memo[key] = best_score
+            if x_to_move:
+                policy[(cbx, cbo, 0)] = SYMS[sym][best_move]
+            return best_score
+
+        # Cover games where X opens and games where the human (O) opens
+        solve(0, 0, True, 0)
+        solve(0, 0, False, 0)
+        return policy
+
     def load_statistics(self):
         """Load game statistics from file."""
         try:
@@ -61,130 +377,132 @@ class UltimateTicTacToeAI:
                     self.ai_wins = data.get('ai_wins', 0)
                     self.human_wins = data.get('human_wins', 0)
                     self.ties = data.get('ties', 0)
-                    self.game_history = data.get('game_history', [])
+                    self.game_history = deque(data.get('game_history', []), maxlen=20)
                     self.game_id = data.get('next_game_id', 1)
         except Exception as e:
             # If file is corrupted, start fresh
             pass
     
-    def save_statistics(self):
-        """Save game statistics to file."""
+    def save_statistics(self, timestamp: Optional[str] = None):
+        """Save game statistics to file.
+
+        record_game passes the timestamp it already computed so the
+        back-to-back game-end calls hit the clock only once.
+        """
         data = {
             'ai_wins': self.ai_wins,
             'human_wins': self.human_wins,
             'ties': self.ties,
-            'game_history': self.game_history[-20:],  # Keep last 20 games
+            'game_history': list(self.game_history),  # deque already caps at 20
             'next_game_id': self.game_id + 1,
-            'last_updated': datetime.now().isoformat()
+            'last_updated': timestamp or datetime.now().isoformat()
         }
         try:
-            with open(self.save_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.save_file, 'wb') as f:
+                f.write(_dumps(data))
         except:
             pass
     
+    def _board_nums_lines(self) -> List[str]:
+        """Board position reference as a list of pre-colored lines."""
+        C, Y, R = self.colors['CYAN'], self.colors['YELLOW'], self.colors['RESET']
+        return [
+            f"{C}\nBoard Positions Reference:{R}",
+            f"{Y} 0 │ 1 │ 2 {R}",
+            f"{Y}───┼───┼───{R}",
+            f"{Y} 3 │ 4 │ 5 {R}",
+            f"{Y}───┼───┼───{R}",
+            f"{Y} 6 │ 7 │ 8 {R}",
+        ]
+
     def print_board_nums(self):
         """Show board with position numbers."""
-        print(self.color_text("\nBoard Positions Reference:", 'CYAN'))
-        print(self.color_text(" 0 │ 1 │ 2 ", 'YELLOW'))
-        print(self.color_text("───┼───┼───", 'YELLOW'))
-        print(self.color_text(" 3 │ 4 │ 5 ", 'YELLOW'))
-        print(self.color_text("───┼───┼───", 'YELLOW'))
-        print(self.color_text(" 6 │ 7 │ 8 ", 'YELLOW'))
+        sys.stdout.write('\n'.join(self._board_nums_lines()) + '\n')
     
-    def print_board(self):
-        """Print the current game board with colors."""
-        print(self.color_text("\nCurrent Game Board:", 'CYAN'))
-        print()
-        
+    def _board_lines(self) -> List[str]:
+        """Current board as a list of pre-colored lines."""
+        colors = self.colors
+        C, RED, GREEN, Y, R = (colors['CYAN'], colors['RED'], colors['GREEN'],
+                               colors['YELLOW'], colors['RESET'])
+        lines = [f"{C}\nCurrent Game Board:{R}", ""]
+
+        board = self.board
         for row in range(3):
-            print("   ", end="")
+            cells = []
             for col in range(3):
                 idx = row * 3 + col
-                symbol = self.board[idx]
-                
+                symbol = board[idx]
+
                 # Color the symbols
                 if symbol == 'X':
-                    print(self.color_text(f" {symbol} ", 'RED'), end="")
+                    cells.append(f"{RED} {symbol} {R}")
                 elif symbol == 'O':
-                    print(self.color_text(f" {symbol} ", 'GREEN'), end="")
+                    cells.append(f"{GREEN} {symbol} {R}")
                 else:
-                    print(self.color_text(f" {idx} ", 'YELLOW'), end="")
-                
-                if col != 2:
-                    print("│", end="")
-            
-            print()
+                    cells.append(f"{Y} {idx} {R}")
+
+            lines.append("   " + "│".join(cells))
             if row != 2:
-                print("   " + "───┼───┼───")
-        
-        print()
+                lines.append("   ───┼───┼───")
+
+        lines.append("")
+        return lines
+
+    def print_board(self):
+        """Print the current game board with colors."""
+        sys.stdout.write('\n'.join(self._board_lines()) + '\n')
     
+    @property
+    def board(self) -> List[str]:
+        """String view of the bitboards, for display and game history."""
+        bx, bo = self.bx, self.bo
+        return ['X' if (bx >> i) & 1 else 'O' if (bo >> i) & 1 else ' '
+                for i in range(9)]
+
     def available_moves(self) -> List[int]:
         """Get list of available moves."""
-        return [i for i, spot in enumerate(self.board) if spot == ' ']
-    
+        return list(_bits(FULL_BOARD & ~(self.bx | self.bo)))
+
     def empty_squares(self) -> bool:
         """Check if there are empty squares."""
-        return ' ' in self.board
-    
+        return (self.bx | self.bo) != FULL_BOARD
+
     def num_empty_squares(self) -> int:
         """Count number of empty squares."""
-        return self.board.count(' ')
-    
+        return 9 - _popcount(self.bx | self.bo)
+
+    def _do(self, move: int, letter: str):
+        """Set a cell's bit."""
+        if letter == 'X':
+            self.bx |= 1 << move
+        else:
+            self.bo |= 1 << move
+
+    def _undo(self, move: int, letter: str):
+        """Clear a cell's bit."""
+        if letter == 'X':
+            self.bx &= ~(1 << move)
+        else:
+            self.bo &= ~(1 << move)
+
     def make_move(self, square: int, letter: str) -> bool:
         """Make a move on the board."""
-        if self.board[square] == ' ':
-            self.board[square] = letter
+        if not ((self.bx | self.bo) >> square) & 1:
+            self._do(square, letter)
             if self.check_winner(square, letter):
                 self.current_winner = letter
             return True
         return False
-    
+
     def check_winner(self, square: int, letter: str) -> bool:
         """Check if the current move wins the game."""
-        # Check row
-        row_ind = square // 3
-        row = self.board[row_ind*3:(row_ind+1)*3]
-        if all([spot == letter for spot in row]):
-            return True
-        
-        # Check column
-        col_ind = square % 3
-        column = [self.board[col_ind+i*3] for i in range(3)]
-        if all([spot == letter for spot in column]):
-            return True
-        
-        # Check diagonals
-        if square % 2 == 0:  # Diagonals only on even squares (0, 2, 4, 6, 8)
-            diagonal1 = [self.board[i] for i in [0, 4, 8]]
-            if all([spot == letter for spot in diagonal1]):
-                return True
-            diagonal2 = [self.board[i] for i in [2, 4, 6]]
-            if all([spot == letter for spot in diagonal2]):
-                return True
-        
-        return False
-    
+        bb = self.bx if letter == 'X' else self.bo
+        return any(bb & mask == mask for mask in LINES_THROUGH[square])
+
     def check_winner_any(self, letter: str) -> bool:
         """Check if a specific letter has won."""
-        # Check rows
-        for row in range(3):
-            if all(self.board[row*3 + col] == letter for col in range(3)):
-                return True
-        
-        # Check columns
-        for col in range(3):
-            if all(self.board[row*3 + col] == letter for row in range(3)):
-                return True
-        
-        # Check diagonals
-        if all(self.board[i] == letter for i in [0, 4, 8]):
-            return True
-        if all(self.board[i] == letter for i in [2, 4, 6]):
-            return True
-        
-        return False
+        bb = self.bx if letter == 'X' else self.bo
+        return any(bb & mask == mask for mask in WIN_MASKS)
     
     def minimax(self, depth: int, is_maximizing: bool, alpha: float = -math.inf, 
                 beta: float = math.inf, use_alpha_beta: bool = True) -> Tuple[int, int]:
@@ -193,113 +511,186 @@ class UltimateTicTacToeAI:
         Returns (score, best_move)
         """
         self.nodes_explored += 1
-        
-        # Terminal states
-        if self.check_winner_any('X'):
-            return 10 - depth, -1
-        if self.check_winner_any('O'):
-            return -10 + depth, -1
-        if not self.empty_squares():
+
+        # Terminal states, inlined: bound-method calls per node are a
+        # measurable share of the interpreter cost at this call frequency
+        bx = self.bx
+        bo = self.bo
+        for mask in WIN_MASKS:
+            if bx & mask == mask:
+                return 10 - depth, -1
+            if bo & mask == mask:
+                return -10 + depth, -1
+        occupied = bx | bo
+        if occupied == FULL_BOARD:
             return 0, -1
-        
+
+        # Transposition-table probe. Win/loss scores are depth-relative
+        # (10 - depth), so entries are normalized to the node when stored
+        # and re-adjusted to the current ply on retrieval. The table only
+        # returns below the root so the root always yields a real move.
+        # Key the table on the symmetry-canonical position so all eight
+        # rotations/reflections of a state share one entry; stored moves
+        # live in the canonical frame and are mapped back via _INV
+        alpha_orig = alpha
+        beta_orig = beta
+        cbx, cbo, sym = _canonical(bx, bo)
+        key = (cbx, cbo, is_maximizing)
+        tt_move = -1
+        entry = self._tt.get(key)
+        if entry is not None:
+            tt_depth, tt_flag, tt_value, tt_move = entry
+            if tt_move >= 0:
+                tt_move = _INV[sym][tt_move]
+            if tt_depth <= depth and depth > 0:
+                value = (tt_value - depth if tt_value > 0
+                         else tt_value + depth if tt_value < 0 else 0)
+                if tt_flag == TT_EXACT:
+                    return value, tt_move
+                elif tt_flag == TT_LOWERBOUND:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if use_alpha_beta and beta <= alpha:
+                    return value, tt_move
+
+        # Try the hash move, then the killer from this depth, then the
+        # static center/corners/edges order
+        killer = self._killer[depth]
+        order = _ordered_moves(tt_move, killer)
+
         if is_maximizing:
             best_score = -math.inf
             best_move = -1
-            for move in self.available_moves():
-                self.board[move] = 'X'
+            for move in order:
+                if (occupied >> move) & 1:
+                    continue
+                self._do(move, 'X')
                 score, _ = self.minimax(depth + 1, False, alpha, beta, use_alpha_beta)
-                self.board[move] = ' '
-                
+                self._undo(move, 'X')
+
                 if score > best_score:
                     best_score = score
                     best_move = move
-                
+
                 if use_alpha_beta:
                     alpha = max(alpha, score)
                     if beta <= alpha:
+                        self._killer[depth] = move
                         break  # Beta cutoff
-            
-            return best_score, best_move
         else:
             best_score = math.inf
             best_move = -1
-            for move in self.available_moves():
-                self.board[move] = 'O'
+            for move in order:
+                if (occupied >> move) & 1:
+                    continue
+                self._do(move, 'O')
                 score, _ = self.minimax(depth + 1, True, alpha, beta, use_alpha_beta)
-                self.board[move] = ' '
-                
+                self._undo(move, 'O')
+
                 if score < best_score:
                     best_score = score
                     best_move = move
-                
+
                 if use_alpha_beta:
                     beta = min(beta, score)
                     if beta <= alpha:
+                        self._killer[depth] = move
                         break  # Alpha cutoff
-            
-            return best_score, best_move
-    
+
+        # Store the result with a flag recording how the window closed
+        if best_score <= alpha_orig:
+            flag = TT_UPPERBOUND
+        elif best_score >= beta_orig:
+            flag = TT_LOWERBOUND
+        else:
+            flag = TT_EXACT
+        stored = (best_score + depth if best_score > 0
+                  else best_score - depth if best_score < 0 else 0)
+        stored_move = SYMS[sym][best_move] if best_move >= 0 else -1
+        self._tt[key] = (depth, flag, stored, stored_move)
+
+        return best_score, best_move
+
+    def _search_root(self) -> int:
+        """Search the current position and return X's best move.
+
+        Uses the JIT-compiled free function when Numba is installed,
+        otherwise the transposition-table-assisted minimax method.
+        """
+        if HAVE_NUMBA:
+            _, move, nodes = _minimax_nb(self.bx, self.bo, 0, -1000, 1000, True)
+            self.nodes_explored += nodes
+            return move
+        _, move = self.minimax(0, True, use_alpha_beta=True)
+        return move
+
     def get_ai_move_easy(self) -> int:
         """AI makes a random move (easy difficulty)."""
-        available = self.available_moves()
-        
+        empty = FULL_BOARD & ~(self.bx | self.bo)
+
         # Occasionally make a good move
         if random.random() < 0.3:
             # Try to win if possible
-            for move in available:
-                self.board[move] = 'X'
+            for move in _bits(empty):
+                self._do(move, 'X')
                 if self.check_winner(move, 'X'):
-                    self.board[move] = ' '
+                    self._undo(move, 'X')
                     return move
-                self.board[move] = ' '
-            
+                self._undo(move, 'X')
+
             # Try to block human win
-            for move in available:
-                self.board[move] = 'O'
+            for move in _bits(empty):
+                self._do(move, 'O')
                 if self.check_winner(move, 'O'):
-                    self.board[move] = ' '
+                    self._undo(move, 'O')
                     return move
-                self.board[move] = ' '
-        
-        return random.choice(available)
+                self._undo(move, 'O')
+
+        return random.choice(self.available_moves())
     
     def get_ai_move_medium(self) -> int:
         """AI with moderate intelligence."""
-        available = self.available_moves()
-        
+        empty = FULL_BOARD & ~(self.bx | self.bo)
+
         # 1. Try to win
-        for move in available:
-            self.board[move] = 'X'
+        for move in _bits(empty):
+            self._do(move, 'X')
             if self.check_winner(move, 'X'):
-                self.board[move] = ' '
+                self._undo(move, 'X')
                 return move
-            self.board[move] = ' '
-        
+            self._undo(move, 'X')
+
         # 2. Block human win
-        for move in available:
-            self.board[move] = 'O'
+        for move in _bits(empty):
+            self._do(move, 'O')
             if self.check_winner(move, 'O'):
-                self.board[move] = ' '
+                self._undo(move, 'O')
                 return move
-            self.board[move] = ' '
-        
+            self._undo(move, 'O')
+
         # 3. Take center if available
-        if 4 in available:
+        if (empty >> 4) & 1:
             return 4
-        
-        # 4. Take corners
-        corners = [0, 2, 6, 8]
-        available_corners = [corner for corner in corners if corner in available]
-        if available_corners:
-            return random.choice(available_corners)
-        
+
+        # 4. Take corners: rejection-sample the fixed tuple rather than
+        # building a filtered list per call
+        corner_bits = empty & CORNER_MASK
+        if corner_bits:
+            while True:
+                corner = random.choice(CORNERS)
+                if (corner_bits >> corner) & 1:
+                    return corner
+
         # 5. Take edges
-        edges = [1, 3, 5, 7]
-        available_edges = [edge for edge in edges if edge in available]
-        if available_edges:
-            return random.choice(available_edges)
-        
-        return random.choice(available)
+        edge_bits = empty & EDGE_MASK
+        if edge_bits:
+            while True:
+                edge = random.choice(EDGES)
+                if (edge_bits >> edge) & 1:
+                    return edge
+
+        return random.choice(self.available_moves())
     
     def get_ai_move_hard(self) -> int:
         """AI with hard difficulty using minimax with limited depth."""
@@ -313,17 +704,30 @@ class UltimateTicTacToeAI:
             else:
                 return random.choice([0, 2, 6, 8])
         
-        # Use minimax with limited depth for faster play
-        _, move = self.minimax(0, True, use_alpha_beta=True)
-        return move
+        # Full-width alpha-beta search from the current position
+        return self._search_root()
     
     def get_ai_move_unbeatable(self) -> int:
-        """Unbeatable AI using full minimax with alpha-beta pruning."""
+        """Unbeatable AI served from the precomputed perfect-play policy."""
         self.nodes_explored = 0
         start_time = time.time()
-        
-        _, move = self.minimax(0, True, use_alpha_beta=True)
-        
+
+        occupied = self.bx | self.bo
+        if occupied == 0:
+            # Opening move: the center is provably optimal
+            move = 4
+        elif self.bx == 0 and occupied in OPENING_REPLY:
+            # Human opened; answer from the tiny opening table
+            move = OPENING_REPLY[occupied]
+        else:
+            cbx, cbo, sym = _canonical(self.bx, self.bo)
+            move = self._policy.get((cbx, cbo, 0), -1)
+            if move >= 0:
+                move = _INV[sym][move]  # back to the real board's frame
+            else:
+                # Shouldn't happen, but fall back to a live search
+                move = self._search_root()
+
         end_time = time.time()
         thinking_time = end_time - start_time
         
@@ -351,25 +755,25 @@ class UltimateTicTacToeAI:
         print(self.color_text("\n📊 Position Analysis:", 'MAGENTA'))
         
         # Check winning chances
-        available = self.available_moves()
-        
+        empty = FULL_BOARD & ~(self.bx | self.bo)
+
         # Can AI win in next move?
-        for move in available:
-            self.board[move] = 'X'
+        for move in _bits(empty):
+            self._do(move, 'X')
             if self.check_winner(move, 'X'):
-                self.board[move] = ' '
+                self._undo(move, 'X')
                 print(self.color_text("   • AI can win next move!", 'GREEN'))
                 return
-            self.board[move] = ' '
-        
+            self._undo(move, 'X')
+
         # Can human win in next move?
-        for move in available:
-            self.board[move] = 'O'
+        for move in _bits(empty):
+            self._do(move, 'O')
             if self.check_winner(move, 'O'):
-                self.board[move] = ' '
+                self._undo(move, 'O')
                 print(self.color_text("   • Human can win next move!", 'RED'))
                 return
-            self.board[move] = ' '
+            self._undo(move, 'O')
         
         # Evaluate board score
         score = self.evaluate_board()
@@ -381,65 +785,15 @@ class UltimateTicTacToeAI:
             print(self.color_text(f"   • Position is balanced (score: {score})", 'YELLOW'))
         
         # Strategic advice
-        if 4 in available:  # Center available
+        if (empty >> 4) & 1:  # Center available
             print(self.color_text("   • Center control is available (key position!)", 'CYAN'))
-        
-        corners = [corner for corner in [0, 2, 6, 8] if corner in available]
-        if len(corners) >= 2:
+
+        if _popcount(empty & CORNER_MASK) >= 2:
             print(self.color_text("   • Multiple corners available (good strategic positions)", 'CYAN'))
     
     def evaluate_board(self) -> int:
         """Evaluate the board state."""
-        # Check for win/lose
-        if self.check_winner_any('X'):
-            return 100
-        if self.check_winner_any('O'):
-            return -100
-        
-        # Heuristic evaluation
-        score = 0
-        
-        # Evaluate rows, columns, and diagonals
-        lines = [
-            # Rows
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],
-            # Columns
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],
-            # Diagonals
-            [0, 4, 8], [2, 4, 6]
-        ]
-        
-        for line in lines:
-            values = [self.board[i] for i in line]
-            x_count = values.count('X')
-            o_count = values.count('O')
-            empty_count = values.count(' ')
-            
-            # Award points for potential wins
-            if x_count == 2 and empty_count == 1:
-                score += 10
-            elif o_count == 2 and empty_count == 1:
-                score -= 10
-            elif x_count == 1 and empty_count == 2:
-                score += 1
-            elif o_count == 1 and empty_count == 2:
-                score -= 1
-        
-        # Center control bonus
-        if self.board[4] == 'X':
-            score += 3
-        elif self.board[4] == 'O':
-            score -= 3
-        
-        # Corner control bonus
-        corners = [0, 2, 6, 8]
-        for corner in corners:
-            if self.board[corner] == 'X':
-                score += 2
-            elif self.board[corner] == 'O':
-                score -= 2
-        
-        return score
+        return _evaluate(self.bx, self.bo)
     
     def show_game_tips(self):
         """Display strategic tips for the game."""
@@ -457,18 +811,22 @@ class UltimateTicTacToeAI:
     def play_turn(self, player: str) -> bool:
         """Handle a single turn."""
         self.clear_screen()
-        
-        # Show header
-        print(self.color_text("=" * 60, 'CYAN'))
-        print(self.color_text("🤖 ULTIMATE TIC-TAC-TOE AI".center(60), 'GREEN'))
-        print(self.color_text("=" * 60, 'CYAN'))
-        
-        # Show game info
-        print(self.color_text(f"\nGame #{self.game_id} | Difficulty: {self.difficulty.upper()}", 'YELLOW'))
-        print(self.color_text(f"Score: AI {self.ai_wins} - {self.human_wins} You | Ties: {self.ties}", 'CYAN'))
-        
-        self.print_board_nums()
-        self.print_board()
+
+        # Build the whole frame (header, game info, reference, board)
+        # and emit it with a single write
+        colors = self.colors
+        C, G, Y, R = colors['CYAN'], colors['GREEN'], colors['YELLOW'], colors['RESET']
+        bar = f"{C}{'=' * 60}{R}"
+        lines = [
+            bar,
+            f"{G}{'🤖 ULTIMATE TIC-TAC-TOE AI'.center(60)}{R}",
+            bar,
+            f"{Y}\nGame #{self.game_id} | Difficulty: {self.difficulty.upper()}{R}",
+            f"{C}Score: AI {self.ai_wins} - {self.human_wins} You | Ties: {self.ties}{R}",
+        ]
+        lines += self._board_nums_lines()
+        lines += self._board_lines()
+        sys.stdout.write('\n'.join(lines) + '\n')
         
         if player == self.human_player:
             # Human turn
@@ -500,7 +858,7 @@ class UltimateTicTacToeAI:
                         print(self.color_text("Please enter a number between 0 and 8", 'RED'))
                         continue
                     
-                    if self.board[move] != ' ':
+                    if ((self.bx | self.bo) >> move) & 1:
                         print(self.color_text("That position is already taken!", 'RED'))
                         continue
                     
@@ -515,17 +873,19 @@ class UltimateTicTacToeAI:
             print(self.color_text(f"\n🤖 AI's turn ({player})", 'RED'))
             print(self.color_text("AI is thinking...", 'YELLOW'))
             
-            # Show thinking animation
-            for _ in range(3):
-                time.sleep(0.3)
-                print(".", end="", flush=True)
-            print()
-            
+            # Show thinking animation (cosmetic only, off by default)
+            if self.show_animations:
+                for _ in range(3):
+                    time.sleep(0.3)
+                    print(".", end="", flush=True)
+                print()
+
             move = self.get_ai_move()
             self.make_move(move, player)
-            
+
             print(self.color_text(f"AI plays at position {move}", 'RED'))
-            time.sleep(1)
+            if self.show_animations:
+                time.sleep(1)
             return True
     
     def change_difficulty(self):
@@ -535,9 +895,11 @@ class UltimateTicTacToeAI:
         print(self.color_text("2. Medium (Basic strategy)", 'YELLOW'))
         print(self.color_text("3. Hard (Advanced strategy)", 'YELLOW'))
         print(self.color_text("4. Unbeatable (Perfect play)", 'YELLOW'))
-        
+        animations_state = 'ON' if self.show_animations else 'OFF'
+        print(self.color_text(f"5. Toggle AI thinking animation (currently {animations_state})", 'YELLOW'))
+
         while True:
-            choice = input("Enter choice (1-4): ").strip()
+            choice = input("Enter choice (1-5): ").strip()
             if choice == '1':
                 self.difficulty = 'easy'
                 break
@@ -550,6 +912,12 @@ class UltimateTicTacToeAI:
             elif choice == '4':
                 self.difficulty = 'unbeatable'
                 break
+            elif choice == '5':
+                self.show_animations = not self.show_animations
+                state = 'ON' if self.show_animations else 'OFF'
+                print(self.color_text(f"Thinking animation turned {state}!", 'GREEN'))
+                time.sleep(1)
+                return
             else:
                 print(self.color_text("Invalid choice!", 'RED'))
         
@@ -581,7 +949,7 @@ class UltimateTicTacToeAI:
         
         if total_games > 0:
             print(self.color_text("\nRecent Games History:", 'MAGENTA'))
-            for game in self.game_history[-5:]:
+            for game in list(self.game_history)[-5:]:
                 winner = game.get('winner', 'Tie')
                 if winner == 'X':
                     print(self.color_text(f"  Game {game['id']}: AI won in {game['moves']} moves", 'RED'))
@@ -597,13 +965,14 @@ class UltimateTicTacToeAI:
     
     def record_game(self, moves: int, winner: str):
         """Record game results."""
+        timestamp = datetime.now().isoformat()
         game_data = {
             'id': self.game_id,
-            'date': datetime.now().isoformat(),
+            'date': timestamp,
             'difficulty': self.difficulty,
             'moves': moves,
             'winner': winner,
-            'board': self.board.copy()
+            'board': self.board  # property builds a fresh list
         }
         self.game_history.append(game_data)
         
@@ -613,8 +982,8 @@ class UltimateTicTacToeAI:
             self.human_wins += 1
         else:
             self.ties += 1
-        
-        self.save_statistics()
+
+        self.save_statistics(timestamp)
     
     def show_winner_animation(self, winner: str):
         """Show winning animation."""
@@ -635,10 +1004,13 @@ class UltimateTicTacToeAI:
         print(self.color_text("=" * 60, color))
         
         # Animated board
-        for _ in range(3):
+        if self.show_animations:
+            for _ in range(3):
+                self.print_board()
+                time.sleep(0.5)
+                print("\n" * 2)
+        else:
             self.print_board()
-            time.sleep(0.5)
-            print("\n" * 2)
     
     def show_game_over_screen(self, winner: str, moves: int):
         """Display game over screen."""
@@ -679,8 +1051,11 @@ class UltimateTicTacToeAI:
     
     def reset_game(self):
         """Reset the game board."""
-        self.board = [' ' for _ in range(9)]
+        self.bx = 0
+        self.bo = 0
         self.current_winner = None
+        self._tt.clear()
+        self._killer = [-1] * 10
         self.game_id += 1
     
     def run(self):